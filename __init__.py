@@ -40,6 +40,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import Future
+from functools import lru_cache
+from threading import Lock
+from urllib.parse import quote_plus
 
 from ovos_utils import classproperty
 from ovos_utils.log import LOG
@@ -51,10 +55,17 @@ from neon_utils.user_utils import get_message_user, get_user_prefs
 from neon_utils.hana_utils import request_backend
 
 
+@lru_cache(maxsize=512)
+def _normalize_cached(utterance: str) -> str:
+    return normalize(utterance, remove_articles=False)
+
+
 class WolframAlphaSkill(CommonQuerySkill):
     def __init__(self, **kwargs):
         CommonQuerySkill.__init__(self, **kwargs)
         self.queries = {}
+        self._inflight = {}
+        self._inflight_lock = Lock()
 
     @classproperty
     def runtime_requirements(self):
@@ -84,7 +95,7 @@ class WolframAlphaSkill(CommonQuerySkill):
             self.speak_dialog("response", {"response": result.rstrip('.')})
             self.queries[user] = utterance
             url = 'https://www.wolframalpha.com/input?i=' + \
-                  utterance.replace(' ', '+')
+                  quote_plus(utterance)
             self.gui.show_url(url)
 
     def CQS_match_query_phrase(self, utt, message):
@@ -106,12 +117,12 @@ class WolframAlphaSkill(CommonQuerySkill):
             user = data['user']
             self.queries[user] = data["query"]
             url = 'https://www.wolframalpha.com/input?i=' + \
-                  data["query"].replace(' ', '+')
+                  quote_plus(data["query"])
             self.gui.show_url(url)
 
     def handle_get_sources(self, message):
         user = get_message_user(message)
-        if user in self.queries.keys():
+        if user in self.queries:
             last_query = self.queries[user]
             preference_user = get_user_prefs(message)["user"]
             email_addr = preference_user["email"]
@@ -121,7 +132,7 @@ class WolframAlphaSkill(CommonQuerySkill):
                 body = f"\nHere is the answer to your question: " \
                        f"{last_query}\nView result on Wolfram|Alpha: " \
                        f"https://www.wolframalpha.com/input/?i=" \
-                       f"{last_query.replace(' ', '+')}\n\n" \
+                       f"{quote_plus(last_query)}\n\n" \
                        f"-Neon"
                 # Send Email
                 self.send_email(title, body, message, email_addr)
@@ -133,7 +144,7 @@ class WolframAlphaSkill(CommonQuerySkill):
             self.speak_dialog("no.info.to.send", private=True)
 
     def _query_wolfram(self, utterance, message) -> (str, str):
-        query = normalize(utterance, remove_articles=False)
+        query = _normalize_cached(utterance)
         # parsed_question = self.question_parser.parse(utterance)
         # LOG.debug(parsed_question)
         # if not parsed_question:
@@ -144,16 +155,16 @@ class WolframAlphaSkill(CommonQuerySkill):
         # utt_word = parsed_question.get('QuestionWord')
         # utt_verb = parsed_question.get('QuestionVerb')
         # utt_query = parsed_question.get('Query')
-        # LOG.debug(len(str(utt_query).split()))
         # query = "%s %s %s" % (utt_word, utt_verb, utt_query)
-        LOG.info(f"Querying WolframAlpha: {query}")
+        LOG.info("Querying WolframAlpha: %s", query)
 
-        preference_location = get_user_prefs(message)["location"]
+        user_prefs = get_user_prefs(message)
+        preference_location = user_prefs["location"]
         lat = str(preference_location['lat'])
         lng = str(preference_location['lng'])
-        units = str(get_user_prefs(message)["units"]["measure"])
+        units = str(user_prefs["units"]["measure"])
         query_type = "short" if message.context.get("klat_data") else "spoken"
-        key = (utterance, lat, lng, units, repr(query_type))
+        key = (utterance, lat, lng, units, query_type)
 
         # if "convert" in query:
         #     to_convert = utt_query[:utt_query.index(utt_query.split(" ")[-1])]
@@ -163,11 +174,32 @@ class WolframAlphaSkill(CommonQuerySkill):
         kwargs = {"lat": lat, "lon": lng, "api": query_type, "units": units,
                   "query": query}
 
+        result = self._get_backend_response(key, kwargs)
+        LOG.info("result=%s", result)
+        return result, key
+
+    def _get_backend_response(self, key: tuple, kwargs: dict) -> str:
+        """
+        Request an answer from the backend. Concurrent calls with the same
+        key wait on the first caller's request instead of sending their own.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+        if not is_owner:
+            return future.result()
+
+        result = None
         try:
             result = request_backend("proxy/wolframalpha",
                                      kwargs).get("answer")
         except Exception as e:
             LOG.error(e)
-            result = None
-        LOG.info(f"result={result}")
-        return result, key
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            future.set_result(result)
+        return result